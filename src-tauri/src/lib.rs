@@ -506,11 +506,11 @@ async fn install_mod_from_zip(
         "install",
         &parsed_name,
         |_channel| {
-            // Open the zip
+            // Open the zip (buffered: the zip reader issues many small reads and seeks)
             let file =
                 fs::File::open(&zip_path).map_err(|e| format!("Failed to open zip: {}", e))?;
-            let mut archive =
-                ZipArchive::new(file).map_err(|e| format!("Invalid zip archive: {}", e))?;
+            let mut archive = ZipArchive::new(io::BufReader::new(file))
+                .map_err(|e| format!("Invalid zip archive: {}", e))?;
 
             // Scan once to detect if it's a plugins or autorun mod
             let mut is_autorun = false;
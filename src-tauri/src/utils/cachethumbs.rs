@@ -1,16 +1,44 @@
 // src-tauri/src/utils/cachethumbs.rs
-use base64::{engine::general_purpose, Engine};
+use base64::{engine::general_purpose, read::DecoderReader, write::EncoderStringWriter};
 use log::{debug, info, warn};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
-use std::path::PathBuf;
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+use std::time::UNIX_EPOCH;
 use tauri::{AppHandle, Manager};
+use crate::utils::parallel;
 // Image cache entry metadata
 #[derive(Serialize, Deserialize, Clone, Debug)]
 pub struct CacheEntry {
     pub original_path: String, // Original image path
     pub timestamp: i64,        // When cached (unix timestamp)
+    #[serde(default)]
+    pub source_fingerprint: Option<SourceFingerprint>, // Original file state when cached (absent in older entries)
+}
+
+/// Modification time and size of the original image, used to tell whether a
+/// cached copy still matches it
+#[derive(Serialize, Deserialize, Clone, Debug, PartialEq)]
+pub struct SourceFingerprint {
+    pub modified_ns: u128,
+    pub len: u64,
+}
+
+/// Fingerprint the image at `path`, or None if it can't be stat'ed
+fn source_fingerprint(path: &str) -> Option<SourceFingerprint> {
+    let metadata = fs::metadata(path).ok()?;
+    let modified_ns = metadata
+        .modified()
+        .ok()?
+        .duration_since(UNIX_EPOCH)
+        .ok()?
+        .as_nanos();
+    Some(SourceFingerprint {
+        modified_ns,
+        len: metadata.len(),
+    })
 }
 
 /// Get the image cache directory path
@@ -40,6 +68,21 @@ pub fn get_image_cache_key(image_path: &str) -> String {
     format!("{:x}", hasher.finish())
 }
 
+/// Base64-encode a file by streaming it through the encoder, so only the
+/// encoded string is held in memory instead of the raw bytes as well
+fn encode_file_base64(path: &Path) -> io::Result<String> {
+    let mut file = fs::File::open(path)?;
+    let len = file.metadata().map(|m| m.len() as usize).unwrap_or(0);
+    let capacity = base64::encoded_len(len, true).unwrap_or(0);
+
+    let mut encoder = EncoderStringWriter::from_consumer(
+        String::with_capacity(capacity),
+        &general_purpose::STANDARD,
+    );
+    io::copy(&mut file, &mut encoder)?;
+    Ok(encoder.into_inner())
+}
+
 /// Function to read mod image files and return as base64
 #[tauri::command]
 pub fn read_mod_image(image_path: String) -> Result<String, String> {
@@ -50,16 +93,14 @@ pub fn read_mod_image(image_path: String) -> Result<String, String> {
         return Err(format!("Image file does not exist: {}", image_path));
     }
 
-    // Read the image file
-    let img_data = fs::read(&path).map_err(|e| format!("Failed to read image file: {}", e))?;
-
-    // Convert to base64
-    let base64_encoded = general_purpose::STANDARD.encode(&img_data);
+    // Read the image file and convert to base64 in one pass
+    let base64_encoded =
+        encode_file_base64(&path).map_err(|e| format!("Failed to read image file: {}", e))?;
 
     info!(
-        "Successfully read image: {} ({} bytes)",
+        "Successfully read image: {} ({} base64 bytes)",
         image_path,
-        img_data.len()
+        base64_encoded.len()
     );
     Ok(base64_encoded)
 }
@@ -84,6 +125,7 @@ pub async fn cache_mod_image(
     let cache_info = CacheEntry {
         original_path: image_path.clone(),
         timestamp: chrono::Utc::now().timestamp(),
+        source_fingerprint: source_fingerprint(&image_path),
     };
 
     let cache_info_json = serde_json::to_string(&cache_info)
@@ -93,15 +135,95 @@ pub async fn cache_mod_image(
     fs::write(&cache_info_path, cache_info_json)
         .map_err(|e| format!("Failed to write cache info: {}", e))?;
 
-    // Write the image data
-    match general_purpose::STANDARD.decode(&image_data) {
-        Ok(decoded_data) => {
-            fs::write(&cache_file_path, decoded_data)
-                .map_err(|e| format!("Failed to write image cache file: {}", e))?;
+    // Write the image data, decoding straight into the file rather than into
+    // an intermediate buffer the size of the image
+    match decode_base64_to_file(&image_data, &cache_file_path) {
+        Ok(()) => {
             debug!("Successfully cached image at {:?}", cache_file_path);
             Ok(())
         }
-        Err(e) => Err(format!("Failed to decode image data: {}", e)),
+        Err(e) => {
+            // Don't leave a truncated image behind for the new cache info to vouch for
+            let _ = fs::remove_file(&cache_file_path);
+            if e.kind() == io::ErrorKind::InvalidData {
+                Err(format!("Failed to decode image data: {}", e))
+            } else {
+                Err(format!("Failed to write image cache file: {}", e))
+            }
+        }
+    }
+}
+
+/// Stream-decode base64 `data` into the file at `path`. Invalid input is
+/// reported as `io::ErrorKind::InvalidData`.
+fn decode_base64_to_file(data: &str, path: &Path) -> io::Result<()> {
+    let mut decoder = DecoderReader::new(data.as_bytes(), &general_purpose::STANDARD);
+    let mut writer = io::BufWriter::new(fs::File::create(path)?);
+    io::copy(&mut decoder, &mut writer)?;
+    writer.flush()
+}
+
+/// Look up one image in the cache and return it base64-encoded, if a valid
+/// entry exists for exactly this path
+fn load_cached_image(cache_dir: &Path, path: &str) -> Option<String> {
+    let cache_key = get_image_cache_key(path);
+    let cache_file_path = cache_dir.join(format!("{}.cache", cache_key));
+    let cache_info_path = cache_dir.join(format!("{}.json", cache_key));
+
+    // Read and validate cache info. Opening it directly doubles as the existence
+    // check, saving two stats per lookup; a missing cache file is handled below.
+    let info_json = match fs::read_to_string(&cache_info_path) {
+        Ok(json) => json,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            debug!("No cache found for: {}", path);
+            return None;
+        }
+        Err(e) => {
+            warn!("Failed to read cache info: {}", e);
+            return None;
+        }
+    };
+    let cache_info = match serde_json::from_str::<CacheEntry>(&info_json) {
+        Ok(info) => info,
+        Err(e) => {
+            warn!("Failed to parse cache info: {}", e);
+            return None;
+        }
+    };
+
+    // Verify it's for the right path (in case of hash collision)
+    if cache_info.original_path != path {
+        warn!(
+            "Cache key collision: {} vs {}",
+            cache_info.original_path, path
+        );
+        return None;
+    }
+
+    // Only serve the cached copy while the original image is unchanged (one stat).
+    // Entries written before fingerprints were recorded are treated as stale.
+    match (&cache_info.source_fingerprint, source_fingerprint(path)) {
+        (Some(cached), Some(current)) if *cached == current => {}
+        _ => {
+            debug!("Original image changed or missing, will reload: {}", path);
+            return None;
+        }
+    }
+
+    // Read and return the cached image
+    match encode_file_base64(&cache_file_path) {
+        Ok(base64_data) => {
+            debug!("Retrieved image from cache: {}", path);
+            Some(base64_data)
+        }
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            debug!("Cache info without image data, will reload: {}", path);
+            None
+        }
+        Err(e) => {
+            warn!("Failed to read cached image data: {}", e);
+            None
+        }
     }
 }
 
@@ -111,68 +233,22 @@ pub async fn get_cached_mod_images(
     app_handle: AppHandle,
     image_paths: Vec<String>,
 ) -> Result<HashMap<String, String>, String> {
-    let mut result = HashMap::new();
     let cache_dir = get_image_cache_dir(&app_handle)?;
 
     let image_paths_count = image_paths.len();
 
-    // For each requested path
-    for path in image_paths {
-        let cache_key = get_image_cache_key(&path);
-        let cache_file_path = cache_dir.join(format!("{}.cache", cache_key));
-        let cache_info_path = cache_dir.join(format!("{}.json", cache_key));
-
-        // Check if both the cache file and info exist
-        if cache_file_path.exists() && cache_info_path.exists() {
-            // Read and validate cache info
-            match fs::read_to_string(&cache_info_path) {
-                Ok(info_json) => {
-                    match serde_json::from_str::<CacheEntry>(&info_json) {
-                        Ok(cache_info) => {
-                            // Verify it's for the right path (in case of hash collision)
-                            if cache_info.original_path != path {
-                                warn!(
-                                    "Cache key collision: {} vs {}",
-                                    cache_info.original_path, path
-                                );
-                                continue;
-                            }
-
-                            // Check if cache is not too old (e.g., older than 7 days)
-                            // I am not sure why we are checking the cache age...doesn't seem to be useful - users are not going to be installing hundreds of skins
-                            let now = chrono::Utc::now().timestamp();
-                            let age = now - cache_info.timestamp;
-                            if age > 7 * 24 * 60 * 60 {
-                                // 7 days in seconds
-                                debug!("Cache entry too old ({}), will reload: {}", age, path);
-                                continue;
-                            }
-
-                            // Read and return the cached image
-                            match fs::read(&cache_file_path) {
-                                Ok(data) => {
-                                    let base64_data = general_purpose::STANDARD.encode(data);
-                                    result.insert(path.clone(), base64_data);
-                                    debug!("Retrieved image from cache: {}", path);
-                                }
-                                Err(e) => {
-                                    warn!("Failed to read cached image data: {}", e);
-                                }
-                            }
-                        }
-                        Err(e) => {
-                            warn!("Failed to parse cache info: {}", e);
-                        }
-                    }
-                }
-                Err(e) => {
-                    warn!("Failed to read cache info: {}", e);
-                }
-            }
-        } else {
-            debug!("No cache found for: {}", path);
-        }
-    }
+    // Reading is blocking file I/O, so keep it off the async runtime's workers.
+    // Reads are independent, so the batch is spread over worker threads.
+    let result: HashMap<String, String> = tauri::async_runtime::spawn_blocking(move || {
+        let images = parallel::map_chunked(&image_paths, |path| load_cached_image(&cache_dir, path));
+        image_paths
+            .into_iter()
+            .zip(images)
+            .filter_map(|(path, data)| Some((path, data?)))
+            .collect()
+    })
+    .await
+    .map_err(|e| format!("Failed to read cached images: {}", e))?;
 
     info!(
         "Retrieved {} cached images out of {} requested",
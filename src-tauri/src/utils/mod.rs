@@ -1,6 +1,7 @@
 pub mod cachethumbs;
 pub mod config;
 pub mod modregistry;
+pub mod parallel;
 pub mod tempermission;
 pub mod pakregistry;
 pub mod skinregistry;
\ No newline at end of file
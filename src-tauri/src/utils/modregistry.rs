@@ -9,7 +9,10 @@ use std::path::{Path, PathBuf};
 use tauri::{AppHandle, Manager};
 use walkdir::WalkDir;
 use std::collections::{HashMap, HashSet};
-use std::io::{BufRead, BufReader};
+use std::sync::{Mutex, MutexGuard};
+use std::time::SystemTime;
+use once_cell::sync::Lazy;
+use crate::utils::parallel;
 
 /// Core representation of a mod in the registry
 #[derive(Debug, Serialize, Deserialize, Clone)]
@@ -36,7 +39,7 @@ pub struct Mod {
 }
 
 /// Types of mods that can be installed
-#[derive(Debug, Serialize, Deserialize, Clone, PartialEq)]
+#[derive(Debug, Serialize, Deserialize, Clone, Copy, PartialEq, Eq)]
 pub enum ModType {
     REFrameworkPlugin,  // Installed to reframework/plugins/
     REFrameworkAutorun, // Installed to reframework/autorun/
@@ -68,7 +71,7 @@ pub struct ModFile {
 }
 
 /// Enum to categorize mod files
-#[derive(Debug, Serialize, Deserialize, Clone, PartialEq)]
+#[derive(Debug, Serialize, Deserialize, Clone, Copy, PartialEq, Eq)]
 pub enum ModFileType {
     PakFile,     // .pak file
     NativesFile, // File inside natives directory
@@ -121,6 +124,31 @@ pub struct ModListContainer {
     pub skins: Vec<SkinMetadata>,
 }
 
+/// Last registry parsed from disk, keyed by the file's path, mtime and size.
+/// Commands load the registry several times per user action; this lets
+/// repeated loads skip the read + JSON parse while the file is unchanged.
+struct CachedRegistry {
+    path: PathBuf,
+    modified: SystemTime,
+    len: u64,
+    registry: ModRegistry,
+}
+
+static REGISTRY_CACHE: Lazy<Mutex<Option<CachedRegistry>>> = Lazy::new(|| Mutex::new(None));
+
+/// Lock the registry cache. Loads and saves hold this across their file I/O
+/// so a cached registry always matches the file it was stamped from.
+fn lock_registry_cache() -> MutexGuard<'static, Option<CachedRegistry>> {
+    // The cache is plain data, so a panic while it was held can't leave it inconsistent
+    REGISTRY_CACHE.lock().unwrap_or_else(|e| e.into_inner())
+}
+
+/// Modification time and size of the file at `path`, used to stamp cache entries
+fn file_stamp(path: &Path) -> Option<(SystemTime, u64)> {
+    let metadata = fs::metadata(path).ok()?;
+    Some((metadata.modified().ok()?, metadata.len()))
+}
+
 // --------------------------------
 // ModRegistry Implementation
 // --------------------------------
@@ -200,6 +228,21 @@ impl ModRegistry {
             return Ok(Self::new());
         }
 
+        // Hold the cache across stat, read and parse so a concurrent save can't
+        // replace the file in between. The stamp is taken before the read, so a
+        // change racing with it makes the entry look stale rather than fresh.
+        let mut cache = lock_registry_cache();
+        let stamp = file_stamp(&registry_path);
+
+        // Reuse the previous parse if the file hasn't changed since
+        if let Some(cached) = cache
+            .as_ref()
+            .filter(|c| c.path == registry_path && Some((c.modified, c.len)) == stamp)
+        {
+            log::debug!("Using cached mod registry for {}", registry_path.display());
+            return Ok(cached.registry.clone());
+        }
+
         // Read the file contents
         match fs::read_to_string(&registry_path) {
             Ok(content) => {
@@ -216,11 +259,18 @@ impl ModRegistry {
                             registry.mods.len(),
                             registry.skin_mods.len()
                         );
+                        *cache = stamp.map(|(modified, len)| CachedRegistry {
+                            path: registry_path.clone(),
+                            modified,
+                            len,
+                            registry: registry.clone(),
+                        });
                         Ok(registry)
                     }
                     Err(e) => {
-                        // Handle legacy format
+                        // Handle legacy format; migration saves, which takes the lock itself
                         warn!("Failed to parse registry file as ModRegistry: {}", e);
+                        drop(cache);
                         Self::migrate_from_legacy(content, app_handle)
                     }
                 }
@@ -244,9 +294,22 @@ impl ModRegistry {
         let content = serde_json::to_string_pretty(self)
             .map_err(|e| format!("Failed to serialize mod registry: {}", e))?;
 
-        // Write to file
-        fs::write(&registry_path, content)
-            .map_err(|e| format!("Failed to write mod registry: {}", e))?;
+        // Write to file and stamp the in-memory copy under one lock, so another
+        // save can't land between our write and our stat
+        let mut cache = lock_registry_cache();
+        if let Err(e) = fs::write(&registry_path, content) {
+            *cache = None;
+            return Err(format!("Failed to write mod registry: {}", e));
+        }
+
+        // Keep the in-memory copy in step with what we just wrote
+        *cache = file_stamp(&registry_path).map(|(modified, len)| CachedRegistry {
+            path: registry_path.clone(),
+            modified,
+            len,
+            registry: self.clone(),
+        });
+        drop(cache);
 
         info!("Successfully saved mod registry");
         Ok(())
@@ -680,13 +743,13 @@ pub async fn toggle_mod_enabled_state(
     Ok(())
 }
 
+/// Common delimiters used in mod folder names
+const MOD_NAME_DELIMITERS: &[char] = &['_', '-', ' ', '!', '#', '$', '.', '(', '['];
+
 /// Extract a cleaner mod name from folder name
 pub fn extract_mod_name_from_folder(folder_name: &str) -> String {
-    // Common delimiters used in mod folder names
-    let delimiters = &['_', '-', ' ', '!', '#', '$', '.', '(', '['];
-
     // Check if there's any delimiter in the folder name
-    if let Some(first_delimiter_pos) = folder_name.find(|c| delimiters.contains(&c)) {
+    if let Some(first_delimiter_pos) = folder_name.find(MOD_NAME_DELIMITERS) {
         // If found delimiter, return everything before it
         if first_delimiter_pos > 0 {
             return folder_name[..first_delimiter_pos].to_string();
@@ -711,6 +774,29 @@ pub fn extract_mod_name_from_folder(folder_name: &str) -> String {
     folder_name.to_string()
 }
 
+/// Whether a listed entry is a directory, using the file type the directory
+/// listing already returned. Only symlinks need a stat to resolve their target.
+fn entry_is_dir(file_type: fs::FileType, path: &Path) -> bool {
+    if file_type.is_symlink() {
+        path.is_dir()
+    } else {
+        file_type.is_dir()
+    }
+}
+
+/// Whether a listed entry is a regular file (see `entry_is_dir`)
+fn entry_is_file(file_type: fs::FileType, path: &Path) -> bool {
+    if file_type.is_symlink() {
+        path.is_file()
+    } else {
+        file_type.is_file()
+    }
+}
+
+/// How deep skin mod folders are walked when probing them and searching for
+/// screenshots (WalkDir depth, so root + 3 levels)
+const SKIN_PROBE_DEPTH: usize = 4;
+
 /// Find screenshot in a mod directory (more robust version)
 fn find_screenshot(mod_dir: &Path) -> Option<String> {
     let image_extensions = ["png", "jpg", "jpeg", "webp", "gif", "bmp"]; // Added more extensions
@@ -719,7 +805,7 @@ fn find_screenshot(mod_dir: &Path) -> Option<String> {
     if let Ok(entries) = fs::read_dir(mod_dir) {
         for entry in entries.filter_map(Result::ok) {
             let path = entry.path();
-            if path.is_file() {
+            if entry.file_type().is_ok_and(|ft| entry_is_file(ft, &path)) {
                 if let Some(ext) = path.extension().and_then(|s| s.to_str()) {
                     if image_extensions.iter().any(|e| ext.eq_ignore_ascii_case(e)) {
                         log::debug!("Found screenshot in root: {}", path.display());
@@ -740,7 +826,7 @@ fn find_screenshot(mod_dir: &Path) -> Option<String> {
     // max_depth(2) means root + 1 level down.
     // max_depth(4) means root + 3 levels down.
     for entry in WalkDir::new(mod_dir)
-        .max_depth(4) // Search mod_dir + 3 levels of subdirectories
+        .max_depth(SKIN_PROBE_DEPTH) // Search mod_dir + 3 levels of subdirectories
         .into_iter()
         .filter_map(Result::ok)
         .filter(|e| e.path() != mod_dir && e.file_type().is_file()) // Skip root, only files
@@ -758,9 +844,15 @@ fn find_screenshot(mod_dir: &Path) -> Option<String> {
     None
 }
 
+/// Matches installed patch paks (enabled or disabled) and captures the patch number.
+/// Compiled once and shared, since patch lookups run for every .pak installed.
+static PATCH_PAK_REGEX: Lazy<Regex> = Lazy::new(|| {
+    Regex::new(r"re_chunk_000\.pak\.sub_000\.pak\.patch_(\d{3})\.pak(?:\.disabled)?$").unwrap()
+});
+
 /// Helper function to find the next available patch number in the game root directory
 fn find_next_available_patch_number(game_root: &Path) -> Result<u32, String> {
-    let pak_regex = Regex::new(r"re_chunk_000\.pak\.sub_000\.pak\.patch_(\d{3})\.pak(?:\.disabled)?$").unwrap();
+    let pak_regex = &*PATCH_PAK_REGEX;
     let mut max_num: u32 = 0;
     let mut found_any = false;
 
@@ -770,7 +862,7 @@ fn find_next_available_patch_number(game_root: &Path) -> Result<u32, String> {
         Ok(entries) => {
             for entry in entries.filter_map(Result::ok) {
                 let path = entry.path();
-                if path.is_file() {
+                if entry.file_type().is_ok_and(|ft| entry_is_file(ft, &path)) {
                     if let Some(file_name) = path.file_name().and_then(|n| n.to_str()) {
                         if let Some(caps) = pak_regex.captures(file_name) {
                             if let Some(num_str) = caps.get(1) {
@@ -802,52 +894,61 @@ fn find_next_available_patch_number(game_root: &Path) -> Result<u32, String> {
 /// Scans REFramework directories, compares with registry, and updates registry state.
 fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path: &Path) -> Result<(), String> {
     log::debug!("Scanning REFramework directories in {}", game_root_path.display());
-    let mut found_on_disk = HashSet::new();
-    let mut disk_mod_info = HashMap::new(); // Store details like enabled status and path
+
+    /// A mod directory found on disk, keyed by base name in `disk_mod_info`
+    struct DiskMod {
+        enabled: bool,
+        installed_dir: String,
+        mod_type: ModType,
+        in_registry: bool, // Set when the registry pass matches it, so it isn't added again
+    }
+    let mut disk_mod_info: HashMap<String, DiskMod> = HashMap::new();
 
     let plugins_dir = game_root_path.join("reframework").join("plugins");
     let autorun_dir = game_root_path.join("reframework").join("autorun");
 
     // Helper closure to scan a directory - mark as mutable
     let mut scan_dir = |dir: &Path, mod_type: ModType| -> Result<(), String> {
-        if !dir.exists() {
-            log::warn!("REFramework directory not found: {}, skipping scan.", dir.display());
-            return Ok(());
-        }
+        let entries = match fs::read_dir(dir) {
+            Ok(entries) => entries,
+            Err(e) if e.kind() == io::ErrorKind::NotFound => {
+                log::warn!("REFramework directory not found: {}, skipping scan.", dir.display());
+                return Ok(());
+            }
+            Err(e) => return Err(format!("Failed to read directory {}: {}", dir.display(), e)),
+        };
         log::debug!("Scanning directory: {}", dir.display());
-        for entry in fs::read_dir(dir)
-            .map_err(|e| format!("Failed to read directory {}: {}", dir.display(), e))? {
+        for entry in entries {
             let entry = entry.map_err(|e| format!("Failed to read entry in {}: {}", dir.display(), e))?;
             let path = entry.path();
-            if path.is_dir() { // Check if it's a directory
+            if entry.file_type().is_ok_and(|ft| entry_is_dir(ft, &path)) { // Check if it's a directory
                 let file_name_os = entry.file_name();
                 if let Some(name_str) = file_name_os.to_str() {
                     let is_enabled = !name_str.ends_with(".disabled");
-                    let base_name = if is_enabled {
-                        name_str.to_string()
-                    } else {
-                        name_str.trim_end_matches(".disabled").to_string()
-                    };
+                    // No-op for enabled names, so both cases share one borrowed slice
+                    let base_name = name_str.trim_end_matches(".disabled");
 
                     if !base_name.is_empty() {
                         let rel_path = path.strip_prefix(game_root_path)
-                            .map(|p| p.to_string_lossy().to_string())
-                            .unwrap_or_else(|_| name_str.to_string()); // Fallback to original name
-
-                        let installed_dir = if is_enabled {
-                            rel_path.clone()
-                        } else {
-                            rel_path.trim_end_matches(".disabled").to_string()
-                        };
+                            .map(|p| p.to_string_lossy())
+                            .unwrap_or_else(|_| name_str.into()); // Fallback to original name
+                        let installed_dir = rel_path.trim_end_matches(".disabled");
 
                         log::trace!("Found mod directory: {} (Enabled: {}) -> Base: {}, InstalledDir: {}",
                                     name_str, is_enabled, base_name, installed_dir);
 
                         // Store info, potentially overwriting if both enabled/disabled exist (prefer enabled)
-                        if !disk_mod_info.contains_key(&base_name) || is_enabled {
-                             disk_mod_info.insert(base_name.clone(), (is_enabled, installed_dir, mod_type.clone()));
+                        let info = DiskMod {
+                            enabled: is_enabled,
+                            installed_dir: installed_dir.to_string(),
+                            mod_type,
+                            in_registry: false,
+                        };
+                        if is_enabled {
+                            disk_mod_info.insert(base_name.to_string(), info);
+                        } else {
+                            disk_mod_info.entry(base_name.to_string()).or_insert(info);
                         }
-                        found_on_disk.insert(base_name);
                     }
                 }
             }
@@ -859,11 +960,10 @@ fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path:
     scan_dir(&plugins_dir, ModType::REFrameworkPlugin)?;
     scan_dir(&autorun_dir, ModType::REFrameworkAutorun)?;
 
-    log::debug!("Found {} potential REFramework mods on disk: {:?}", found_on_disk.len(), found_on_disk);
+    log::debug!("Found {} potential REFramework mods on disk: {:?}", disk_mod_info.len(), disk_mod_info.keys());
 
     // --- Compare with Registry ---
     let _mods_to_remove_from_registry: Vec<String> = Vec::new();
-    let mut registry_mod_names = HashSet::new();
 
     // First pass: Update existing mods in registry and check for removals
     for mod_entry in registry.mods.iter_mut() {
@@ -873,16 +973,17 @@ fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path:
         }
 
         let mod_name = &mod_entry.directory_name;
-        registry_mod_names.insert(mod_name.clone());
 
-        if let Some((disk_enabled, disk_installed_dir, disk_mod_type)) = disk_mod_info.get(mod_name) {
+        if let Some(disk_mod) = disk_mod_info.get_mut(mod_name) {
+            disk_mod.in_registry = true;
+            let DiskMod { enabled: disk_enabled, installed_dir: disk_installed_dir, mod_type: disk_mod_type, .. } = &*disk_mod;
             // Mod exists on disk, update status in registry
             if mod_entry.enabled != *disk_enabled {
                  log::info!("Updating status for mod '{}': {} -> {}", mod_name, mod_entry.enabled, disk_enabled);
                  mod_entry.enabled = *disk_enabled;
             }
             // Optionally update installed_directory if it differs? Or assume registry is correct if source wasn't manual?
-            if mod_entry.installed_directory != *disk_installed_dir && mod_entry.source == Some("manual_scan".to_string()) {
+            if mod_entry.installed_directory != *disk_installed_dir && mod_entry.source.as_deref() == Some("manual_scan") {
                  log::info!("Updating installed directory for manually scanned mod '{}': '{}' -> '{}'",
                            mod_name, mod_entry.installed_directory, disk_installed_dir);
                  mod_entry.installed_directory = disk_installed_dir.clone();
@@ -890,7 +991,7 @@ fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path:
             // Update mod type if it changed (e.g., moved from autorun to plugins)
              if mod_entry.mod_type != *disk_mod_type {
                  log::info!("Updating mod type for mod '{}': {:?} -> {:?}", mod_name, mod_entry.mod_type, disk_mod_type);
-                 mod_entry.mod_type = disk_mod_type.clone();
+                 mod_entry.mod_type = *disk_mod_type;
              }
 
         } else {
@@ -898,7 +999,7 @@ fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path:
             log::warn!("Mod '{}' found in registry but not on disk. Marking as disabled.", mod_name);
             mod_entry.enabled = false;
             // Optionally, we could completely remove it here if source is "manual_scan"
-            // if mod_entry.source == Some("manual_scan".to_string()) {
+            // if mod_entry.source.as_deref() == Some("manual_scan") {
             //    mods_to_remove_from_registry.push(mod_name.clone());
             // }
         }
@@ -911,25 +1012,26 @@ fn scan_and_update_reframework_mods(registry: &mut ModRegistry, game_root_path:
 
     // Second pass: Add mods found on disk but not in registry
     let mut added_new_mod = false;
-    for disk_mod_name in found_on_disk.difference(&registry_mod_names) {
-        if let Some((disk_enabled, disk_installed_dir, disk_mod_type)) = disk_mod_info.get(disk_mod_name) {
-            log::info!("Found manually added mod '{}' on disk. Adding to registry.", disk_mod_name);
-            let new_mod = Mod {
-                name: disk_mod_name.clone(), // Use directory name as display name initially
-                directory_name: disk_mod_name.clone(),
-                path: "Manually Detected".to_string(), // Indicate it wasn't installed via manager
-                enabled: *disk_enabled,
-                author: None,
-                version: None,
-                description: None,
-                source: Some("manual_scan".to_string()),
-                installed_timestamp: chrono::Utc::now().timestamp(),
-                installed_directory: disk_installed_dir.clone(),
-                mod_type: disk_mod_type.clone(),
-            };
-            registry.mods.push(new_mod);
-            added_new_mod = true;
+    for (disk_mod_name, disk_mod) in disk_mod_info {
+        if disk_mod.in_registry {
+            continue;
         }
+        log::info!("Found manually added mod '{}' on disk. Adding to registry.", disk_mod_name);
+        let new_mod = Mod {
+            name: disk_mod_name.clone(), // Use directory name as display name initially
+            directory_name: disk_mod_name,
+            path: "Manually Detected".to_string(), // Indicate it wasn't installed via manager
+            enabled: disk_mod.enabled,
+            author: None,
+            version: None,
+            description: None,
+            source: Some("manual_scan".to_string()),
+            installed_timestamp: chrono::Utc::now().timestamp(),
+            installed_directory: disk_mod.installed_dir,
+            mod_type: disk_mod.mod_type,
+        };
+        registry.mods.push(new_mod);
+        added_new_mod = true;
     }
 
     if added_new_mod {
@@ -985,6 +1087,171 @@ pub async fn list_mods(
     Ok(mods_info)
 }
 
+// --------- Skin Mod Probing --------- //
+
+/// Key/value metadata read from a mod's modinfo.ini
+#[derive(Debug, Clone, Default)]
+struct ModInfoIni {
+    name: Option<String>,
+    author: Option<String>,
+    version: Option<String>,
+    description: Option<String>,
+}
+
+/// What a scan learns about one valid skin mod folder in fossmodmanager/mods
+#[derive(Debug, Clone)]
+struct SkinModProbe {
+    path: String,                   // Full path to the mod folder (registry identifier)
+    folder_name: Option<String>,    // Folder name, if valid UTF-8
+    thumbnail_path: Option<String>, // Screenshot found by find_screenshot
+    ini: ModInfoIni,                // Parsed modinfo.ini (empty if absent)
+}
+
+/// Parse name/author/version/description from a mod's modinfo.ini, if present.
+/// Lines that aren't valid UTF-8 are skipped; the rest of the file still counts.
+fn parse_modinfo_ini(mod_dir: &Path) -> ModInfoIni {
+    let mut ini = ModInfoIni::default();
+    let mod_info_path = mod_dir.join("modinfo.ini");
+
+    // Read directly rather than checking existence first; most mods ship no modinfo.ini.
+    // The file is tiny, so read it in one go and scan borrowed lines; only the
+    // values of recognised keys are allocated.
+    let content = match fs::read(&mod_info_path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => return ini,
+        Err(e) => {
+            log::warn!("Could not read modinfo.ini for {}: {}", mod_dir.display(), e);
+            return ini;
+        }
+    };
+    log::trace!("Parsing modinfo.ini for {}", mod_dir.display());
+
+    // Split the raw bytes and decode each line on its own, so one bad line (e.g.
+    // a Latin-1 description) doesn't garble or end the parse; trim() drops any '\r'
+    for raw_line in content.split(|&b| b == b'\n') {
+        let Ok(line) = std::str::from_utf8(raw_line) else { continue };
+        let trimmed_line = line.trim();
+        if trimmed_line.is_empty() || trimmed_line.starts_with(';') || trimmed_line.starts_with('#') { continue; }
+        let Some((key, value)) = trimmed_line.split_once('=') else { continue };
+        let value_trimmed = value.trim();
+        if value_trimmed.is_empty() { continue; }
+        let key_trimmed = key.trim();
+        let field = if key_trimmed.eq_ignore_ascii_case("name") {
+            &mut ini.name
+        } else if key_trimmed.eq_ignore_ascii_case("author") {
+            &mut ini.author
+        } else if key_trimmed.eq_ignore_ascii_case("version") {
+            &mut ini.version
+        } else if key_trimmed.eq_ignore_ascii_case("description") {
+            &mut ini.description
+        } else {
+            continue;
+        };
+        *field = Some(value_trimmed.to_string());
+    }
+
+    ini
+}
+
+/// Inspect one folder in the mods directory. Returns None unless it contains a
+/// `natives` directory or a .pak file within depth 4.
+fn probe_skin_mod_folder(path: &Path) -> Option<SkinModProbe> {
+    log::debug!("Inspecting potential skin mod folder: {:?}", path);
+
+    // --- Filter Check (Recursive, limited depth) ---
+    let mut is_valid_skin_mod = false;
+    // Use WalkDir to check recursively up to depth 4 (root + 3 levels)
+    for inner_entry in WalkDir::new(path)
+        .max_depth(SKIN_PROBE_DEPTH)
+        .into_iter()
+        .filter_map(Result::ok)
+    {
+        let inner_path = inner_entry.path();
+
+        let file_type = inner_entry.file_type();
+
+        // Check if it's a directory named "natives"
+        if inner_entry.file_name().to_str() == Some("natives") && entry_is_dir(file_type, inner_path) {
+            is_valid_skin_mod = true;
+            log::debug!("Found 'natives' directory inside: {}", inner_path.display());
+            break; // Found one condition, no need to check further
+        }
+
+        // Check if it's a file with a .pak extension
+        if entry_is_file(file_type, inner_path) {
+            if let Some(ext) = inner_path.extension().and_then(|s| s.to_str()) {
+                if ext.eq_ignore_ascii_case("pak") {
+                    is_valid_skin_mod = true;
+                    log::debug!("Found .pak file inside: {}", inner_path.display());
+                    break; // Found one condition, no need to check further
+                }
+            }
+        }
+    }
+
+    // Skip if neither condition was met during the recursive check
+    if !is_valid_skin_mod {
+        log::debug!("Skipping directory {:?}: No 'natives' subdir or .pak file found within depth 4.", path);
+        return None;
+    }
+    // --- End Filter Check ---
+
+    Some(SkinModProbe {
+        path: path.to_string_lossy().to_string(),
+        folder_name: path.file_name().and_then(|n| n.to_str()).map(str::to_string),
+        thumbnail_path: find_screenshot(path),
+        ini: parse_modinfo_ini(path),
+    })
+}
+
+/// Probe every folder in the mods directory for skin mods
+fn probe_skin_mods(mods_dir: &Path) -> Vec<SkinModProbe> {
+    let mut folders = Vec::new();
+    match fs::read_dir(mods_dir) {
+        Ok(entries) => {
+            for entry in entries.filter_map(Result::ok) {
+                let path = entry.path();
+                if entry.file_type().is_ok_and(|ft| entry_is_dir(ft, &path)) {
+                    folders.push(path);
+                }
+            }
+        }
+        Err(e) => log::warn!("Failed to read mods directory {}: {}", mods_dir.display(), e),
+    }
+    // Each probe is independent, I/O-bound directory walking, so spread them over worker threads
+    parallel::map_chunked(&folders, |p| probe_skin_mod_folder(p))
+        .into_iter()
+        .flatten()
+        .collect()
+}
+
+/// Derive a display name from a skin mod folder name: the part before the first
+/// delimiter, or the part after an MHW/MHWs prefix
+fn derive_skin_display_name(folder_name: &str) -> String {
+    let cleaned_folder_name: String = folder_name
+        .chars()
+        .filter(|c| !c.is_whitespace() && *c != '\\')
+        .collect();
+
+    match cleaned_folder_name.find(MOD_NAME_DELIMITERS) {
+        Some(first_delim_index) => {
+            let prefix = &cleaned_folder_name[..first_delim_index];
+            if prefix.eq_ignore_ascii_case("mhw") || prefix.eq_ignore_ascii_case("mhws") {
+                // Found MHW(s) prefix, look at the part *after* the delimiter
+                let suffix = &cleaned_folder_name[first_delim_index + 1..];
+                match suffix.find(MOD_NAME_DELIMITERS) {
+                    Some(second_delim_index) => suffix[..second_delim_index].to_string(), // Take part before next delimiter
+                    None => suffix.to_string(), // No more delimiters, take the whole suffix
+                }
+            } else {
+                // Prefix is not MHW(s), just use the prefix
+                prefix.to_string()
+            }
+        }
+        None => cleaned_folder_name, // No delimiters found, use the whole cleaned name
+    }
+}
+
 // --------- Skin Mod Management Commands (Consolidated) --------- //
 
 #[tauri::command]
@@ -1022,277 +1289,131 @@ pub async fn scan_and_update_skin_mods(
         .collect();
 
     let mut updated_or_new_mods = Vec::new();
-    let mut found_mod_paths = std::collections::HashSet::new();
-
-    // Scan the mods directory
-    for entry in WalkDir::new(&mods_dir)
-        .max_depth(1)
-        .into_iter()
-        .filter_map(|e| e.ok())
-    {
-        let path = entry.path();
-
-        // Skip the root directory itself
-        if path == mods_dir {
-            continue;
-        }
-
-        if path.is_dir() {
-            log::debug!("Inspecting potential skin mod folder: {:?}", path);
-
-            // --- Filter Check (Recursive, limited depth) ---
-            let mut is_valid_skin_mod = false;
-            // Use WalkDir to check recursively up to depth 4 (root + 3 levels)
-            for inner_entry in WalkDir::new(path)
-                .max_depth(4)
-                .into_iter()
-                .filter_map(Result::ok)
-            {
-                let inner_path = inner_entry.path();
-
-                // Check if it's a directory named "natives"
-                if inner_path.is_dir() && inner_entry.file_name().to_str() == Some("natives") {
-                    is_valid_skin_mod = true;
-                    log::debug!("Found 'natives' directory inside: {}", inner_path.display());
-                    break; // Found one condition, no need to check further
-                }
+    let mut found_mod_paths = HashSet::new();
+
+    // Probe the mods directory
+    for probe in probe_skin_mods(&mods_dir) {
+        let mod_path = probe.path.clone();
+        found_mod_paths.insert(mod_path.clone());
+
+        // Check if we already have this mod in the registry
+        if let Some(mut existing_mod) = existing_mods.remove(&mod_path) {
+            // Make existing_mod mutable
+
+            // --- Re-apply name extraction logic for existing mods ---
+            // A name from modinfo.ini wins, so only derive one from the folder without it
+            let ini = probe.ini;
+            let display_name = match ini.name {
+                Some(name_from_ini) => name_from_ini,
+                None => derive_skin_display_name(
+                    probe
+                        .folder_name
+                        .as_deref()
+                        .unwrap_or(&existing_mod.base.directory_name), // Fallback to existing dir name if needed
+                ),
+            };
 
-                // Check if it's a file with a .pak extension
-                if inner_path.is_file() {
-                    if let Some(ext) = inner_path.extension().and_then(|s| s.to_str()) {
-                        if ext.eq_ignore_ascii_case("pak") {
-                            is_valid_skin_mod = true;
-                            log::debug!("Found .pak file inside: {}", inner_path.display());
-                            break; // Found one condition, no need to check further
-                        }
-                    }
-                }
+            // Update the name in the existing mod struct if it changed
+            if existing_mod.base.name != display_name {
+                log::debug!(
+                    "Updating name for existing mod '{}': '{}' -> '{}'",
+                    mod_path,
+                    existing_mod.base.name,
+                    display_name
+                );
+                existing_mod.base.name = display_name;
             }
-
-            // Skip if neither condition was met during the recursive check
-            if !is_valid_skin_mod {
-                log::debug!("Skipping directory {:?}: No 'natives' subdir or .pak file found within depth 4.", path);
-                continue;
+            // --- End re-applying name extraction ---
+
+            // --- Always re-check for screenshot for existing mods ---
+            let current_screenshot_path = probe.thumbnail_path;
+            if existing_mod.thumbnail_path != current_screenshot_path {
+                log::debug!(
+                    "Updating thumbnail path for existing mod '{}': {:?} -> {:?}",
+                    mod_path,
+                    existing_mod.thumbnail_path,
+                    current_screenshot_path
+                );
+                existing_mod.thumbnail_path = current_screenshot_path;
             }
-            // --- End Filter Check ---
-
-            // Get mod path as string
-            let mod_path = path.to_string_lossy().to_string();
-            found_mod_paths.insert(mod_path.clone());
-
-            // Check if we already have this mod in the registry
-            if let Some(mut existing_mod) = existing_mods.remove(&mod_path) {
-                // Make existing_mod mutable
-
-                // --- Re-apply name extraction logic for existing mods ---
-                let folder_name = path
-                    .file_name()
-                    .and_then(|n| n.to_str())
-                    .unwrap_or(&existing_mod.base.directory_name) // Fallback to existing dir name if needed
-                    .to_string();
-
-                let delimiters: &[char] = &['_', '-', ' ', '!', '#', '$', '.', '(', '['];
-                let cleaned_folder_name: String = folder_name
-                    .chars()
-                    .filter(|c| !c.is_whitespace() && *c != '\\')
-                    .collect();
-
-                // --- Refined Name Extraction Logic (Handles MHW/MHWs prefix) ---
-                let display_name = match cleaned_folder_name.find(delimiters) {
-                    Some(first_delim_index) => {
-                        let prefix = &cleaned_folder_name[..first_delim_index];
-                        if prefix.eq_ignore_ascii_case("mhw") || prefix.eq_ignore_ascii_case("mhws")
-                        {
-                            // Found MHW(s) prefix, look at the part *after* the delimiter
-                            let suffix = &cleaned_folder_name[first_delim_index + 1..];
-                            match suffix.find(delimiters) {
-                                Some(second_delim_index) => {
-                                    suffix[..second_delim_index].to_string()
-                                } // Take part before next delimiter
-                                None => suffix.to_string(), // No more delimiters, take the whole suffix
-                            }
-                        } else {
-                            // Prefix is not MHW(s), just use the prefix
-                            prefix.to_string()
-                        }
-                    }
-                    None => cleaned_folder_name, // No delimiters found, use the whole cleaned name
-                };
-                // --- End Refined Name Extraction ---
-
-                // Update the name in the existing mod struct if it changed
-                if existing_mod.base.name != display_name {
-                    log::debug!(
-                        "Updating name for existing mod '{}': '{}' -> '{}'",
-                        mod_path,
-                        existing_mod.base.name,
-                        display_name
-                    );
-                    existing_mod.base.name = display_name;
-                }
-                // --- End re-applying name extraction ---
-
-                // --- Always re-check for screenshot for existing mods --- 
-                let current_screenshot_path = find_screenshot(path);
-                if existing_mod.thumbnail_path != current_screenshot_path {
-                    log::debug!(
-                        "Updating thumbnail path for existing mod '{}': {:?} -> {:?}",
-                        mod_path,
-                        existing_mod.thumbnail_path,
-                        current_screenshot_path
-                    );
-                    existing_mod.thumbnail_path = current_screenshot_path;
-                }
-                // --- End screenshot re-check ---
-
-                // --- Parse modinfo.ini *again* within this scope ---
-                let mut ini_name_update: Option<String> = None;
-                let mut ini_author_update: Option<String> = None;
-                let mut ini_version_update: Option<String> = None;
-                let mut ini_description_update: Option<String> = None;
-                let mod_info_path_update = path.join("modinfo.ini"); // path should still be valid here
-
-                if mod_info_path_update.is_file() {
-                    log::trace!("Re-parsing modinfo.ini for existing mod {}", mod_path);
-                    match fs::File::open(&mod_info_path_update) {
-                        Ok(file) => {
-                            let reader = BufReader::new(file);
-                            for line_result in reader.lines() {
-                                if let Ok(line) = line_result {
-                                    let trimmed_line = line.trim();
-                                    if trimmed_line.is_empty() || trimmed_line.starts_with(';') || trimmed_line.starts_with('#') { continue; }
-                                    if let Some((key, value)) = trimmed_line.split_once('=') {
-                                        let key_trimmed = key.trim().to_lowercase();
-                                        let value_trimmed = value.trim().to_string();
-                                        if !value_trimmed.is_empty() {
-                                            match key_trimmed.as_str() {
-                                                "name" => ini_name_update = Some(value_trimmed), // Capture potential name change too
-                                                "author" => ini_author_update = Some(value_trimmed),
-                                                "version" => ini_version_update = Some(value_trimmed),
-                                                "description" => ini_description_update = Some(value_trimmed),
-                                                _ => {}
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        Err(e) => log::warn!("Could not re-open modinfo.ini for {}: {}", folder_name, e),
-                    }
-                } // --- End Re-parsing ---
-
-
-                // --- Update metadata using newly parsed values --- 
-                // Update name if INI specified one (otherwise keep existing derived name)
-                if let Some(name_from_ini) = ini_name_update {
-                     if existing_mod.base.name != name_from_ini {
-                         log::debug!("Updating name for mod '{}' from modinfo.ini: '{}' -> '{}'", mod_path, existing_mod.base.name, name_from_ini);
-                         existing_mod.base.name = name_from_ini;
-                     }
-                 }
-                // Update other fields using the parsed values (which default to None if not found)
-                if existing_mod.base.author != ini_author_update {
-                    log::debug!("Updating author for mod '{}': {:?} -> {:?}", mod_path, existing_mod.base.author, ini_author_update);
-                    existing_mod.base.author = ini_author_update;
-                }
-                if existing_mod.base.version != ini_version_update {
-                     log::debug!("Updating version for mod '{}': {:?} -> {:?}", mod_path, existing_mod.base.version, ini_version_update);
-                     existing_mod.base.version = ini_version_update;
-                }
-                 if existing_mod.base.description != ini_description_update {
-                     log::debug!("Updating description for mod '{}': Changed", mod_path); // Avoid logging potentially long descriptions
-                     existing_mod.base.description = ini_description_update;
-                 }
-                 // --- End Metadata Update --- 
-
-                // --- Re-check installed files if mod is enabled ---
-                if existing_mod.base.enabled {
-                    // If the mod is marked as enabled in registry, but installed files are missing, mark as disabled
-                    let all_files_exist = existing_mod.installed_files.iter().all(|f| PathBuf::from(f).exists());
-                    if !all_files_exist {
-                        log::warn!("Mod '{}' was enabled but installed files are missing. Disabling in registry.", mod_path);
-                        existing_mod.base.enabled = false;
-                        existing_mod.installed_files.clear();
-                        existing_mod.installed_pak_path = None;
-                        // We should probably trigger a save here or after the loop
-                    }
-                }
-                // --- End re-check installed files ---
-
-                updated_or_new_mods.push(existing_mod); // Push the potentially updated mod
-                log::debug!("Found existing mod in registry: {}", mod_path);
-                continue;
+            // --- End screenshot re-check ---
+
+            // --- Update metadata using values parsed from modinfo.ini ---
+            // The name was already taken from the INI above; update the other
+            // fields using the parsed values (which default to None if not found)
+            if existing_mod.base.author != ini.author {
+                log::debug!("Updating author for mod '{}': {:?} -> {:?}", mod_path, existing_mod.base.author, ini.author);
+                existing_mod.base.author = ini.author;
             }
-
-            // If not in registry, it's a new mod
-            log::debug!("Found new potential skin mod: {}", mod_path);
-            let folder_name = path
-                .file_name()
-                .and_then(|n| n.to_str())
-                .unwrap_or("Unknown")
-                .to_string();
-
-            // --- Refined Name Extraction ---
-            let delimiters: &[char] = &['_', '-', ' ', '!', '#', '$', '.', '(', '['];
-            let cleaned_folder_name: String = folder_name
-                .chars()
-                .filter(|c| !c.is_whitespace() && *c != '\\')
-                .collect();
-
-            let display_name = match cleaned_folder_name.find(delimiters) {
-                Some(first_delim_index) => {
-                    let prefix = &cleaned_folder_name[..first_delim_index];
-                    if prefix.eq_ignore_ascii_case("mhw") || prefix.eq_ignore_ascii_case("mhws") {
-                        // Found MHW(s) prefix, look at the part *after* the delimiter
-                        let suffix = &cleaned_folder_name[first_delim_index + 1..];
-                        match suffix.find(delimiters) {
-                            Some(second_delim_index) => suffix[..second_delim_index].to_string(), // Take part before next delimiter
-                            None => suffix.to_string(), // No more delimiters, take the whole suffix
-                        }
-                    } else {
-                        // Prefix is not MHW(s), just use the prefix
-                        prefix.to_string()
-                    }
+            if existing_mod.base.version != ini.version {
+                 log::debug!("Updating version for mod '{}': {:?} -> {:?}", mod_path, existing_mod.base.version, ini.version);
+                 existing_mod.base.version = ini.version;
+            }
+             if existing_mod.base.description != ini.description {
+                 log::debug!("Updating description for mod '{}': Changed", mod_path); // Avoid logging potentially long descriptions
+                 existing_mod.base.description = ini.description;
+             }
+             // --- End Metadata Update ---
+
+            // --- Re-check installed files if mod is enabled ---
+            if existing_mod.base.enabled {
+                // If the mod is marked as enabled in registry, but installed files are missing, mark as disabled
+                let all_files_exist = existing_mod.installed_files.iter().all(|f| PathBuf::from(f).exists());
+                if !all_files_exist {
+                    log::warn!("Mod '{}' was enabled but installed files are missing. Disabling in registry.", mod_path);
+                    existing_mod.base.enabled = false;
+                    existing_mod.installed_files.clear();
+                    existing_mod.installed_pak_path = None;
+                    // We should probably trigger a save here or after the loop
                 }
-                None => cleaned_folder_name, // No delimiters found, use the whole cleaned name
-            };
-            // --- End Refined Name Extraction ---
-
-            let screenshot_path = find_screenshot(path);
-
-            // Create the base Mod struct using parsed info or defaults
-            let base_mod = Mod {
-                name: display_name.clone(),
-                directory_name: folder_name.clone(),
-                path: mod_path.clone(),
-                enabled: false,
-                author: None,      // TODO: Parse from modinfo.ini
-                version: None,     // TODO: Parse from modinfo.ini
-                description: None, // TODO: Parse from modinfo.ini
-                source: Some("local_scan".to_string()),
-                installed_timestamp: chrono::Utc::now().timestamp(),
-                installed_directory: mod_path.clone(),
-                mod_type: ModType::SkinMod,
-            };
+            }
+            // --- End re-check installed files ---
 
-            // Create the SkinMod struct
-            let skin_mod = SkinMod {
-                base: base_mod,
-                thumbnail_path: screenshot_path,
-                conflicts: Vec::new(),
-                files: Vec::new(),
-                installed_files: Vec::new(),
-                installed_pak_path: None,
-            };
-            log::info!(
-                "Adding new skin mod: Name='{}', Path='{}', Author='{:?}', Version='{:?}'",
-                display_name,
-                mod_path,
-                skin_mod.base.author,
-                skin_mod.base.version
-            );
-            updated_or_new_mods.push(skin_mod);
+            updated_or_new_mods.push(existing_mod); // Push the potentially updated mod
+            log::debug!("Found existing mod in registry: {}", mod_path);
+            continue;
         }
+
+        // If not in registry, it's a new mod
+        log::debug!("Found new potential skin mod: {}", mod_path);
+        let folder_name = probe.folder_name.unwrap_or_else(|| "Unknown".to_string());
+
+        let display_name = derive_skin_display_name(&folder_name);
+
+        let screenshot_path = probe.thumbnail_path;
+
+        // Create the base Mod struct using parsed info or defaults
+        let base_mod = Mod {
+            name: display_name.clone(),
+            directory_name: folder_name.clone(),
+            path: mod_path.clone(),
+            enabled: false,
+            author: None,      // TODO: Parse from modinfo.ini
+            version: None,     // TODO: Parse from modinfo.ini
+            description: None, // TODO: Parse from modinfo.ini
+            source: Some("local_scan".to_string()),
+            installed_timestamp: chrono::Utc::now().timestamp(),
+            installed_directory: mod_path.clone(),
+            mod_type: ModType::SkinMod,
+        };
+
+        // Create the SkinMod struct
+        let skin_mod = SkinMod {
+            base: base_mod,
+            thumbnail_path: screenshot_path,
+            conflicts: Vec::new(),
+            files: Vec::new(),
+            installed_files: Vec::new(),
+            installed_pak_path: None,
+        };
+        log::info!(
+            "Adding new skin mod: Name='{}', Path='{}', Author='{:?}', Version='{:?}'",
+            display_name,
+            mod_path,
+            skin_mod.base.author,
+            skin_mod.base.version
+        );
+        updated_or_new_mods.push(skin_mod);
     }
 
     // Update registry with the latest list (removes mods no longer found on disk)
@@ -1353,6 +1474,9 @@ pub async fn enable_skin_mod_via_registry(
 
     let mut installed_files_tracker = Vec::new();
     let mut installed_pak_path_tracker: Option<String> = None;
+    // Resolved from the game root on the first .pak, then advanced locally
+    // instead of rescanning the directory for every file we install
+    let mut next_patch_num: Option<u32> = None;
 
 
     // Walk the mod directory to find .pak and natives/ files
@@ -1372,7 +1496,7 @@ pub async fn enable_skin_mod_via_registry(
         let source_path = entry.path();
 
         // Skip directories
-        if !source_path.is_file() {
+        if !entry_is_file(entry.file_type(), source_path) {
             continue;
         }
 
@@ -1381,8 +1505,12 @@ pub async fn enable_skin_mod_via_registry(
             // Only process .pak files directly in the mod root for now
             // TODO: Decide if we need to handle .pak in subdirs differently
 
-            let next_patch_num = find_next_available_patch_number(&game_root)?;
-            let pak_file_name = format!("re_chunk_000.pak.sub_000.pak.patch_{:03}.pak", next_patch_num);
+            let patch_num = match next_patch_num {
+                Some(n) => n,
+                None => find_next_available_patch_number(&game_root)?,
+            };
+            next_patch_num = Some(patch_num + 1);
+            let pak_file_name = format!("re_chunk_000.pak.sub_000.pak.patch_{:03}.pak", patch_num);
             let dest_path = game_root.join(&pak_file_name);
 
             log::info!(
@@ -1499,12 +1627,43 @@ pub async fn disable_skin_mod_via_registry(
         return Ok(());
     }
 
-    // Get the list of installed files TO REMOVE
-    // Clone it so we don't borrow registry while modifying filesystem
-    let installed_files_to_remove = registry.skin_mods[mod_index].installed_files.clone();
+    let removal_errors = remove_installed_skin_files(&mut registry.skin_mods[mod_index]);
 
-    // Get mutable reference to the mod entry BEFORE removing files
-    let skin_mod_entry = registry.skin_mods.get_mut(mod_index).unwrap();
+    // --- Save the updated registry ---
+    registry.last_updated = chrono::Utc::now().timestamp();
+    if let Err(e) = registry.save(&app_handle) {
+        log::error!("Failed to save registry after disabling mod {}: {}", mod_path, e);
+        // Even if save fails, files might have been removed. State is inconsistent.
+        return Err(format!("Failed to save registry state after disabling mod: {}", e));
+    }
+
+
+    // Report any errors encountered during file removal, but don't fail the operation
+    if !removal_errors.is_empty() {
+        log::error!(
+            "Errors occurred during file removal for '{}': {}. Registry state updated anyway.",
+            mod_path,
+            removal_errors.join("; ")
+        );
+        // Consider if this should be an error communicated to the user,
+        // even if the registry update succeeded. For now, log it as error but return Ok.
+    }
+
+    log::info!(
+        "Successfully disabled skin mod '{}' via registry.",
+        mod_path
+    );
+    Ok(())
+}
+
+/// Remove a skin mod's installed files from the game directory and mark its
+/// registry entry disabled. Does not save the registry; callers already hold
+/// it loaded and save once when done. Returns any per-file removal errors.
+fn remove_installed_skin_files(skin_mod_entry: &mut SkinMod) -> Vec<String> {
+    let mod_path = skin_mod_entry.base.path.clone();
+
+    // Take the list of installed files TO REMOVE (the entry's list is cleared below anyway)
+    let installed_files_to_remove = std::mem::take(&mut skin_mod_entry.installed_files);
 
     log::info!(
         "Removing {} installed files for mod: {}",
@@ -1545,32 +1704,7 @@ pub async fn disable_skin_mod_via_registry(
         skin_mod_entry.base.enabled
     );
 
-
-    // --- Save the updated registry ---
-    registry.last_updated = chrono::Utc::now().timestamp();
-    if let Err(e) = registry.save(&app_handle) {
-        log::error!("Failed to save registry after disabling mod {}: {}", mod_path, e);
-        // Even if save fails, files might have been removed. State is inconsistent.
-        return Err(format!("Failed to save registry state after disabling mod: {}", e));
-    }
-
-
-    // Report any errors encountered during file removal, but don't fail the operation
-    if !removal_errors.is_empty() {
-        log::error!(
-            "Errors occurred during file removal for '{}': {}. Registry state updated anyway.",
-            mod_path,
-            removal_errors.join("; ")
-        );
-        // Consider if this should be an error communicated to the user,
-        // even if the registry update succeeded. For now, log it as error but return Ok.
-    }
-
-    log::info!(
-        "Successfully disabled skin mod '{}' via registry.",
-        mod_path
-    );
-    Ok(())
+    removal_errors
 }
 
 // --------- End Skin Mod Management Commands --------- //
@@ -1662,44 +1796,39 @@ pub async fn delete_reframework_mod(
 #[tauri::command]
 pub async fn delete_skin_mod(
     app_handle: AppHandle,
-    game_root_path: String, // Needed for potential disable call
-    mod_path: String,       // Original source path identifier
+    _game_root_path: String, // Not needed since installed file paths are absolute, kept for consistency
+    mod_path: String,        // Original source path identifier
 ) -> Result<(), String> {
     log::info!("Attempting to delete skin mod with source path: {}", mod_path);
 
-    let app_handle_clone = app_handle.clone(); // Clone for potential disable call
-
     // Load the registry
     let mut registry = ModRegistry::load(&app_handle)?;
 
     // Find the mod entry by its original source path
-    let mod_info = match registry.skin_mods.iter().find(|m| m.base.path == mod_path) {
-        Some(m) => {
-            // Clone necessary info before potential mutable borrow in disable
-            Some((m.base.directory_name.clone(), m.base.enabled))
-        }
-        None => {
-            return Err(format!("Skin mod with source path '{}' not found in registry.", mod_path));
-        }
-    };
+    let mod_index = registry
+        .skin_mods
+        .iter()
+        .position(|m| m.base.path == mod_path)
+        .ok_or_else(|| format!("Skin mod with source path '{}' not found in registry.", mod_path))?;
 
-    let (directory_name_to_remove, is_enabled) = mod_info.unwrap(); // We know it exists
+    let directory_name_to_remove = registry.skin_mods[mod_index].base.directory_name.clone();
 
     let mut combined_errors = Vec::new();
 
     // --- Step 1: Disable the mod first if it's enabled --- 
-    // This handles removing files from the game directory (.pak, natives/)
-    if is_enabled {
+    // This handles removing files from the game directory (.pak, natives/).
+    // Works on the registry already loaded here; it is saved once at the end.
+    if registry.skin_mods[mod_index].base.enabled {
         log::info!("Skin mod '{}' is enabled, disabling it first...", directory_name_to_remove);
-        if let Err(e) = disable_skin_mod_via_registry(app_handle_clone, game_root_path, mod_path.clone()).await {
-            log::error!("Failed to disable skin mod '{}' before deletion: {}. Proceeding with deletion attempt anyway.", directory_name_to_remove, e);
-            combined_errors.push(format!("Error during pre-delete disable: {}", e));
-            // Reload registry as disable might have failed partially but still saved
-            registry = ModRegistry::load(&app_handle)?;
-        } else {
+        let removal_errors = remove_installed_skin_files(&mut registry.skin_mods[mod_index]);
+        if removal_errors.is_empty() {
             log::info!("Successfully disabled skin mod '{}' before deletion.", directory_name_to_remove);
-            // Reload registry as disable function saves it
-            registry = ModRegistry::load(&app_handle)?;
+        } else {
+            log::error!(
+                "Errors occurred during file removal for '{}': {}. Proceeding with deletion anyway.",
+                directory_name_to_remove,
+                removal_errors.join("; ")
+            );
         }
     }
 
@@ -1725,7 +1854,7 @@ pub async fn delete_skin_mod(
             combined_errors.push(format!("Failed to save registry: {}", e));
         }
     } else {
-        // This might happen if disable failed and registry was reloaded without the mod?
+        // Shouldn't happen: the entry was found above and the registry hasn't been reloaded since
         log::warn!("Skin mod '{}' was not found in the registry during final removal attempt.", directory_name_to_remove);
     }
 
@@ -1747,3 +1876,4 @@ pub async fn list_skin_mods_from_registry(app_handle: AppHandle) -> Result<Vec<S
     let registry = ModRegistry::load(&app_handle)?;
     Ok(registry.skin_mods)
 }
+
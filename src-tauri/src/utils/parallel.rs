@@ -0,0 +1,44 @@
+// src-tauri/src/utils/parallel.rs
+
+/// Map `f` over `items` on a few scoped worker threads, one contiguous chunk
+/// each. Meant for independent, I/O-bound work like walking mod folders or
+/// reading cache files; with a single item or core it runs inline.
+/// Results line up with `items`. If mapping panics, the items of that chunk
+/// (all of them when run inline) come back as None instead of the panic propagating.
+pub fn map_chunked<T, R, F>(items: &[T], f: F) -> Vec<Option<R>>
+where
+    T: Sync,
+    R: Send,
+    F: Fn(&T) -> Option<R> + Sync,
+{
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(4)
+        .min(items.len());
+    if workers <= 1 {
+        // Contain a panic the same way a worker thread would
+        let run = std::panic::AssertUnwindSafe(|| items.iter().map(&f).collect());
+        return std::panic::catch_unwind(run).unwrap_or_else(|_| skipped(items));
+    }
+
+    let chunk_size = items.len().div_ceil(workers);
+    let f = &f;
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = items
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || chunk.iter().map(f).collect::<Vec<_>>()))
+            .collect();
+
+        handles
+            .into_iter()
+            .zip(items.chunks(chunk_size))
+            .flat_map(|(handle, chunk)| handle.join().unwrap_or_else(|_| skipped(chunk)))
+            .collect()
+    })
+}
+
+/// Results for a chunk whose mapping panicked
+fn skipped<T, R>(chunk: &[T]) -> Vec<Option<R>> {
+    log::error!("Worker panicked; skipped its {} items", chunk.len());
+    chunk.iter().map(|_| None).collect()
+}